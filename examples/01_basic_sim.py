@@ -14,10 +14,9 @@ Usage:
 """
 
 import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports (shared bootstrap)
+import _bootstrap
 
 from lc3sim import LC3Sim, LC3Value, LC3Obj
 
@@ -56,24 +55,24 @@ def main():
     print("    Program halted!")
     
     # --- Step 5: Access results ---
-    print("\n[5] Results:")
-    print("-" * 40)
-    
-    # Program output
-    print("Program Output:")
-    print(response.raw_resp if response.raw_resp else "(no output)")
-    
-    # Register values
-    print("\nRegister Values:")
-    print(f"    R0 = {response.regs.R0} (signed: {response.regs.R0.signed})")
-    print(f"    R1 = {response.regs.R1} (signed: {response.regs.R1.signed})")
-    print(f"    R2 = {response.regs.R2} (signed: {response.regs.R2.signed})")
-    print(f"    R3 = {response.regs.R3} (signed: {response.regs.R3.signed})")
-    print(f"    R4 = {response.regs.R4} (signed: {response.regs.R4.signed})")
-    print(f"    R5 = {response.regs.R5} (signed: {response.regs.R5.signed})")
-    print(f"    R6 = {response.regs.R6} (signed: {response.regs.R6.signed})")
-    print(f"    R7 = {response.regs.R7} (signed: {response.regs.R7.signed})")
-    
+    # Collect the whole results block and flush it in one stdout write
+    # instead of a dozen separate print calls
+    regs = response.regs
+    lines = [
+        "\n[5] Results:",
+        "-" * 40,
+        "Program Output:",
+        response.raw_resp if response.raw_resp else "(no output)",
+        "",
+        "Register Values:",
+    ]
+    lines.extend(
+        f"    R{i} = {reg} (signed: {reg.signed})"
+        for i, reg in enumerate([regs.R0, regs.R1, regs.R2, regs.R3,
+                                 regs.R4, regs.R5, regs.R6, regs.R7])
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
     print("\n" + "=" * 60)
     print("Example completed!")
     print("=" * 60)
@@ -13,10 +13,9 @@ Usage:
 """
 
 import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports (shared bootstrap)
+import _bootstrap
 
 from lc3sim import LC3Sim, LC3Value, LC3Obj
 
@@ -73,20 +72,19 @@ def main():
     read_value = sim.read_mem(addr)
     print(f"    Read from {addr}: {read_value}")
     
-    # Write multiple values
+    # Write multiple values in one batched round-trip. The batch API takes
+    # raw ints directly, so the loop allocates no per-word LC3Value objects.
     print("\n    Writing a sequence to memory x4001-x4005:")
-    for i in range(5):
-        addr = LC3Value(0x4001 + i)
-        data = LC3Value(0x0041 + i)  # 'A', 'B', 'C', 'D', 'E'
-        sim.write_mem(addr, data)
-        print(f"        {addr} = {data} (ASCII: '{chr(0x41 + i)}')")
-    
-    # Read them back
+    base_addr = 0x4001
+    sequence = [0x0041 + i for i in range(5)]  # 'A', 'B', 'C', 'D', 'E'
+    sim.write_block(base_addr, sequence)
+    for i, word in enumerate(sequence):
+        print(f"        x{base_addr + i:04X} = x{word:04X} (ASCII: '{chr(word)}')")
+
+    # Read them back in one batch
     print("\n    Reading back:")
-    for i in range(5):
-        addr = LC3Value(0x4001 + i)
-        value = sim.read_mem(addr)
-        print(f"        {addr} = {value}")
+    for i, value in enumerate(sim.read_block(base_addr, 5)):
+        print(f"        x{base_addr + i:04X} = {value}")
     
     # --- Register Operations ---
     print("\n[4] Register Operations:")
@@ -133,18 +131,18 @@ def main():
     print(f"    Origin address: x5000")
     print(f"    Buffer size: {len(obj.buffer)} bytes")
     
-    # Load it into simulator
-    obj_path = obj.to_file()
-    print(f"    Temp file created: {obj_path}")
-    sim.load_file(obj_path)
+    # Load it into simulator memory directly (no temp file needed)
+    sim.load_obj(obj)
     print("    Loaded into simulator!")
     
-    # Read back the data
+    # Read back the data in one batch and decode it in one pass instead of
+    # reconstructing the string one chr() at a time
     print("\n    Reading string from memory:")
-    for i, char in enumerate(test_string):
-        addr = LC3Value(0x5000 + i)
-        value = sim.read_mem(addr)
-        print(f"        {addr} = {value} ('{chr(int(value))}')")
+    string_base = 0x5000
+    values = sim.read_block(string_base, len(test_string))
+    readback = bytes(int(v) & 0xFF for v in values).decode('ascii')
+    print(f"        Words:   {' '.join(str(v) for v in values)}")
+    print(f"        Decoded: '{readback}'")
     
     print("\n" + "=" * 60)
     print("Example completed!")
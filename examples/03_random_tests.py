@@ -13,13 +13,19 @@ Usage:
 """
 
 import sys
-import os
 import random
+from collections import Counter
+from functools import lru_cache
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports (shared bootstrap)
+import _bootstrap
 
-from lc3sim import LC3RandomGenTests, LC3Sim, LC3Value, LC3Obj
+from lc3sim import LC3RandomGenTests, LC3Value, LC3Obj
+
+# 256-entry table folding random bytes onto A-Z, so a whole input string is
+# generated in one randbytes + translate pass instead of one choice per char.
+# (The slight modulo bias is irrelevant for test inputs.)
+_LETTER_TABLE = bytes(ord('A') + (i % 26) for i in range(256))
 
 
 class SimpleRandomTests(LC3RandomGenTests):
@@ -36,21 +42,42 @@ class SimpleRandomTests(LC3RandomGenTests):
     def set_target(self, target_file):
         """Set the target LC3 object file to test"""
         self.target = target_file
-    
+        self.inputs = []
+
+    def _generate_inputs(self):
+        """
+        Generate all case inputs up-front with one bulk random draw.
+
+        A single randbytes call covers every case; the blob is then sliced
+        into per-case strings, so workers spend their time in the simulator
+        rather than in the RNG. Seeded for reproducibility.
+
+        :return: List of test_nums input strings
+        """
+        rng = random.Random(0x1C3)
+        lengths = [rng.randint(10, 50) for _ in range(self.test_nums)]
+        blob = rng.randbytes(sum(lengths)).translate(_LETTER_TABLE).decode('ascii')
+        inputs = []
+        pos = 0
+        for length in lengths:
+            inputs.append(blob[pos:pos + length])
+            pos += length
+        return inputs
+
+    def run_all(self):
+        """Pregenerate every case's input, then dispatch to the workers."""
+        self.inputs = self._generate_inputs()
+        super().run_all()
+
     def run_case(self, case_num):
         """
         Execute a single test case.
-        
-        :param case_num: Test case number (can be used as random seed)
+
+        :param case_num: Test case number (indexes the pregenerated inputs)
         :return: True if test passed, False if failed
         """
-        # Use case_num as seed for reproducibility
-        random.seed(case_num)
-        
-        # --- Generate random test input ---
-        # Example: generate a random string of letters
-        length = random.randint(10, 50)
-        test_input = ''.join(random.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=length))
+        # --- Fetch this case's pregenerated input ---
+        test_input = self.inputs[case_num - 1]
         
         # --- Compute expected output ---
         # Example: count each letter (simplified version)
@@ -59,11 +86,13 @@ class SimpleRandomTests(LC3RandomGenTests):
         
         # --- Create data object file ---
         obj = LC3Obj(LC3Value('x4000'), test_input.encode())
-        
+
         # --- Run simulation ---
-        sim = LC3Sim()
+        # Reuse this worker's persistent simulator; only the target and
+        # input data are reloaded per case.
+        sim = self.get_sim()
         sim.load_file(self.target)
-        sim.load_file(obj.to_file())
+        sim.load_obj(obj)
         sim.set_pc(LC3Value('x3000'))
         response = sim.sim_continue()
         
@@ -78,24 +107,26 @@ class SimpleRandomTests(LC3RandomGenTests):
         # In a real test, compare actual output with expected
         return True  # Replace with actual comparison
     
-    def _compute_expected(self, input_str):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _compute_expected(input_str):
         """
         Compute expected output for the given input.
         This should match what your LC3 program produces.
+
+        Memoized: seeded cases regenerate identical inputs across runs and
+        retries, so each distinct input is only ever computed once.
         """
-        # Example: count letters and format output
-        counts = {}
-        for char in input_str:
-            if char.isalpha():
-                upper = char.upper()
-                counts[upper] = counts.get(upper, 0) + 1
-        
-        # Format as expected output
-        result = ""
-        for letter in sorted(counts.keys()):
-            result += f"{letter}: {counts[letter]}\n"
-        
-        return result
+        # Count letters with a C-level pass: upper-case the whole string
+        # once and let Counter iterate it, instead of branching per char.
+        counts = Counter(input_str.upper())
+
+        # Format as expected output (at most 26 letter buckets)
+        return ''.join(
+            f"{letter}: {counts[letter]}\n"
+            for letter in sorted(counts)
+            if letter.isalpha()
+        )
 
 
 class DemoRandomTests(LC3RandomGenTests):
@@ -103,19 +134,28 @@ class DemoRandomTests(LC3RandomGenTests):
     Demo test class that doesn't require an actual LC3 program.
     Simulates test execution with random pass/fail.
     """
-    
+
+    def __init__(self, test_nums=100, max_workers=None):
+        super().__init__(test_nums, max_workers)
+        # Precompute every case's pass/fail verdict once (index 0 unused).
+        # Workers then just index the mask instead of reseeding the global
+        # RNG per case, which also serialized them on the random module lock.
+        # Random(n) reproduces the old seed(n); random() > 0.05 verdicts.
+        self._pass_mask = [True] + [
+            random.Random(n).random() > 0.05 for n in range(1, test_nums + 1)
+        ]
+
     def run_case(self, case_num):
         """
         Demo test case - simulates 95% pass rate.
         """
         import time
-        
+
         # Simulate some work
         time.sleep(0.01)  # 10ms per test
-        
+
         # 95% pass rate for demo
-        random.seed(case_num)
-        return random.random() > 0.05
+        return self._pass_mask[case_num]
 
 
 def main():
@@ -14,18 +14,59 @@ Usage:
 """
 
 import sys
-import os
+from collections import Counter
+from functools import lru_cache
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path for imports (shared bootstrap)
+import _bootstrap
 
 from lc3sim import LC3SequenceTest, LC3Sim, LC3Value, LC3Obj
 
 
+@lru_cache(maxsize=None)
+def compute_expected(input_str):
+    """
+    Compute the expected program output for an input string.
+
+    One shared, memoized function covers every parametrized case, so the
+    same input is never counted twice. Adjust to match your LC3 program's
+    expected behavior (this demo counts letters like example 03).
+
+    :param input_str: Input string fed to the program
+    :return: Expected output string
+    """
+    counts = Counter(input_str.upper())
+    return ''.join(
+        f"{letter}: {counts[letter]}\n"
+        for letter in sorted(counts)
+        if letter.isalpha()
+    )
+
+
+# One simulator per target, shared by every sequence test. The process is
+# spawned once; each test just restores the snapshot by reloading the
+# target and its input data.
+_shared_sims = {}
+
+
+def get_shared_sim(target):
+    """
+    Get (or lazily create) the simulator shared by all tests for a target.
+
+    :param target: Path to LC3 object file
+    :return: The shared LC3Sim instance
+    """
+    sim = _shared_sims.get(target)
+    if sim is None:
+        sim = LC3Sim()
+        _shared_sims[target] = sim
+    return sim
+
+
 def run_test(target, input_str, expected_output):
     """
     Helper function to run a single test case.
-    
+
     :param target: Path to LC3 object file
     :param input_str: Input string to test
     :param expected_output: Expected program output
@@ -33,14 +74,15 @@ def run_test(target, input_str, expected_output):
     """
     # Create data object file
     obj = LC3Obj(LC3Value('x4000'), input_str.encode())
-    
-    # Initialize and run simulator
-    sim = LC3Sim()
+
+    # Reuse the shared simulator; reloading the target restores a clean
+    # program image without paying the process-spawn cost per test
+    sim = get_shared_sim(target)
     sim.load_file(target)
-    sim.load_file(obj.to_file())
+    sim.load_obj(obj)
     sim.set_pc(LC3Value('x3000'))
     response = sim.sim_continue()
-    
+
     # Compare output
     return response.diff_resp(expected_output)
 
@@ -76,71 +118,44 @@ def create_boundary_tests(target):
         return True
     
     # --- Method 2: Using add_test ---
-    
+
     tests.add_test("All uppercase A-Z", lambda: True)
     tests.add_test("All lowercase a-z", lambda: True)
     tests.add_test("Mixed case 'AaBbCc'", lambda: True)
-    
-    # --- Boundary tests ---
-    
-    @tests.test("ASCII boundary: '@' (before 'A')")
-    def test_before_a():
-        # Character just before 'A' in ASCII
-        return True
-    
-    @tests.test("ASCII boundary: '[' (after 'Z')")
-    def test_after_z():
-        # Character just after 'Z' in ASCII
-        return True
-    
-    @tests.test("ASCII boundary: '`' (before 'a')")
-    def test_before_lower_a():
-        return True
-    
-    @tests.test("ASCII boundary: '{' (after 'z')")
-    def test_after_lower_z():
-        return True
-    
-    # --- Length tests ---
-    
-    @tests.test("Minimum length (1 char)")
-    def test_min_length():
-        return True
-    
-    @tests.test("Short string (10 chars)")
-    def test_short():
-        return True
-    
-    @tests.test("Medium string (100 chars)")
-    def test_medium():
-        return True
-    
-    @tests.test("Long string (500 chars)")
-    def test_long():
-        return True
-    
-    # --- Special patterns ---
-    
-    @tests.test("All same character 'AAAA'")
-    def test_same_char():
-        return True
-    
-    @tests.test("Alternating 'AbAbAbAb'")
-    def test_alternating():
-        return True
-    
-    @tests.test("Numbers only '0123456789'")
-    def test_numbers():
-        return True
-    
-    @tests.test("Special chars '!@#$%^&*()'")
-    def test_special():
-        return True
-    
-    @tests.test("Whitespace ' \\t\\n'")
-    def test_whitespace():
-        return True
-    
+
+    # --- Method 3: Declarative tuple table ---
+    # Cases that share one body are registered from a table in a single
+    # add_tests pass instead of one decorator call per test.
+
+    table_cases = [
+        # ASCII boundary tests
+        ("ASCII boundary: '@' (before 'A')", "@"),
+        ("ASCII boundary: '[' (after 'Z')", "["),
+        ("ASCII boundary: '`' (before 'a')", "`"),
+        ("ASCII boundary: '{' (after 'z')", "{"),
+        # Special patterns
+        ("All same character 'AAAA'", "AAAA"),
+        ("Alternating 'AbAbAbAb'", "AbAbAbAb"),
+        ("Numbers only '0123456789'", "0123456789"),
+        ("Special chars '!@#$%^&*()'", "!@#$%^&*()"),
+        ("Whitespace ' \\t\\n'", " \t\n"),
+    ]
+
+    # The length tests are parametrized from one pattern; all of them share
+    # the single memoized compute_expected() instead of four hand-written
+    # expected-output snippets.
+    table_cases.extend(
+        (f"Length boundary ({length} chars)", ("AbCdEfGhIj" * 50)[:length])
+        for length in (1, 10, 100, 500)
+    )
+
+    tests.add_tests(
+        # In a real test:
+        #   lambda s=input_str: run_test(target, s, compute_expected(s))
+        (name, lambda s=input_str: True)
+        for name, input_str in table_cases
+    )
+
     # --- Simulated failure for demo ---
     
     @tests.test("Intentional failure (demo)")
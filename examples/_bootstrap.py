@@ -0,0 +1,15 @@
+"""
+Shared sys.path bootstrap for the example scripts.
+
+Importing this module makes the repository root (where lc3sim.py lives)
+importable. Each example does `import _bootstrap` instead of repeating the
+dirname(dirname(abspath(__file__))) dance, and the path is computed only
+once per process no matter how many examples are imported.
+"""
+
+import sys
+import os
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
@@ -18,24 +18,83 @@ Classes:
 import pexpect
 import sys, os
 import re
-import uuid
-import difflib
+import struct
+import tempfile
 import time
-import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import difflib
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import threading
 
 
+# Precompiled parser patterns; these sit on the hot path of every
+# continue/printregs/translate response.
+_REG_PATTERN = re.compile(r'(\w+)=(x[\da-fA-F]+)')
+_MEM_PATTERN = re.compile(r'Address\s+x[\da-fA-F]+\s+has\s+value\s+(x[\da-fA-F]+)')
+
+# Splits text into lines while consuming the whitespace around each line
+# break, replacing a splitlines + per-line strip pass in diff_resp
+_LINE_SPLIT_PATTERN = re.compile(r'[ \t]*(?:\r\n|[\n\r\f\v])[ \t]*')
+
+# Default worker-pool size, resolved once at import instead of calling
+# os.cpu_count() on every run
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Commands per pipelined burst before draining the queued prompts. Keeps
+# a full MP1-sized block (hundreds of ~20-byte 'memory' commands) well
+# inside the pty input buffer on conservative platforms.
+_MAX_BURST = 64
+
+# Shared LC3Obj tmpfile registry: identical images (keyed by content hash)
+# reuse one on-disk file, refcounted so it outlives every sharing object.
+# Boundary suites that replay the same input hit this; random cases miss.
+_OBJ_FILES = {}
+_OBJ_FILES_LOCK = threading.Lock()
+
+
+class _Colors:
+    """ANSI color codes for terminal output."""
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    RESET = '\033[0m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+
+
+# Status tokens rendered once instead of re-concatenated per result row
+_STATUS_PASS = f"{_Colors.GREEN}PASS{_Colors.RESET}"
+_STATUS_FAIL = f"{_Colors.RED}FAIL{_Colors.RESET}"
+_STATUS_ERROR = f"{_Colors.RED}ERROR{_Colors.RESET}"
+
+
+def _norm_lines(text):
+    """
+    Split text into whitespace-trimmed lines in one regex pass.
+
+    :param text: Multi-line string
+    :return: List of lines with surrounding whitespace removed
+    """
+    text = text.strip()
+    return _LINE_SPLIT_PATTERN.split(text) if text else []
+
+
 class LC3Value:
     """
     A class representing a 16-bit LC-3 value.
-    
+
     Supports multiple input formats and provides conversion utilities.
     All values are automatically truncated to 16 bits (0x0000 - 0xFFFF).
-    
+
+    Instances are immutable and interned: constructing the same raw value
+    twice returns the same object, so hot loops pay for the parse only once.
+
     Attributes:
         _value (int): The internal 16-bit unsigned integer value
-    
+
     Example:
         >>> v1 = LC3Value(0x1234)
         >>> v2 = LC3Value('x5678')
@@ -45,49 +104,91 @@ class LC3Value:
         >>> print(v1.signed)
         4660
     """
-    
-    def __init__(self, value):
+
+    # Frozen layout: the value word plus lazily-filled formatted-string
+    # caches, no per-instance __dict__.
+    __slots__ = ('_value', '_str', '_hex')
+
+    # Intern table mapping raw constructor arguments (int/str) to instances.
+    _CACHE = {}
+
+    def __new__(cls, value):
         """
-        Initialize an LC3 value from various formats.
-        
+        Create (or fetch the cached) LC3 value from various formats.
+
         :param value: The value to convert. Accepts:
             - int: Python integer (e.g., 0x1234, 255)
             - str: LC-3 hex notation ('x1234'), standard hex ('0x1234'),
                    LC-3 decimal ('#100'), or plain hex string ('1234')
         :raises TypeError: If value is not int or str
-        
+
         Example:
             >>> LC3Value(0x1234)      # From Python hex
             >>> LC3Value('x1234')     # From LC-3 notation
             >>> LC3Value('#100')      # From LC-3 decimal
         """
-        self._value = 0
-        
+        cached = cls._CACHE.get(value) if type(value) in (int, str) else None
+        if cached is not None:
+            return cached
+
+        self = super().__new__(cls)
+
+        # Fast path: plain int, truncated to 16 bits (0 ~ 65535) exactly once
+        if type(value) is int:
+            return cls._intern(self, value, value & 0xFFFF)
+
         if isinstance(value, int):
-            self._value = value
-        elif isinstance(value, str):
-            value = value.strip().lower()
-            if value.startswith('x'):
-                # Handle 'x1234' format
-                self._value = int(value[1:], 16)
-            elif value.startswith('0x'):
-                # Handle '0x1234' format
-                self._value = int(value, 16)
-            elif value.startswith('#'):
-                # Handle '#10' (LC3 assembly sometimes uses # for decimal)
-                self._value = int(value[1:])
-            else:
-                # Plain numeric string, try parsing as hex (LC3 output is usually hex)
-                try:
-                    self._value = int(value, 16)
-                except ValueError:
-                    # If conversion fails, might be empty string or other
-                    self._value = 0
-        else:
+            # int subclass (e.g. bool); not worth interning
+            self._value = int(value) & 0xFFFF
+            return self
+
+        if not isinstance(value, str):
             raise TypeError(f"Unsupported type: {type(value)}")
 
-        # Core logic: force truncation to 16 bits (0 ~ 65535)
-        self._value &= 0xFFFF
+        # String parse: dispatch on the leading character
+        text = value.strip().lower()
+        head = text[:1]
+        if head == 'x':
+            # Handle 'x1234' format
+            raw = int(text[1:], 16)
+        elif head == '#':
+            # Handle '#10' (LC3 assembly sometimes uses # for decimal)
+            raw = int(text[1:])
+        elif text[:2] == '0x':
+            # Handle '0x1234' format
+            raw = int(text, 16)
+        else:
+            # Plain numeric string, try parsing as hex (LC3 output is usually hex)
+            try:
+                raw = int(text, 16)
+            except ValueError:
+                # If conversion fails, might be empty string or other
+                raw = 0
+
+        return cls._intern(self, value, raw & 0xFFFF)
+
+    @classmethod
+    def _intern(cls, candidate, key, masked):
+        """
+        Register candidate (or fetch the existing flyweight) for a value.
+
+        Every spelling of the same 16-bit word — 4660, 0x1234, 'x1234',
+        '0x1234' — canonicalizes onto the single instance interned under the
+        masked int, and the raw constructor argument is mapped to it too so
+        the next lookup with that spelling hits on the first _CACHE probe.
+
+        :param candidate: Freshly allocated instance to adopt if uncached
+        :param key: Raw constructor argument (int or str)
+        :param masked: The parsed value truncated to 16 bits
+        :return: The canonical LC3Value for masked
+        """
+        canonical = cls._CACHE.get(masked)
+        if canonical is None:
+            candidate._value = masked
+            cls._CACHE[masked] = canonical = candidate
+        if key != masked:
+            cls._CACHE[key] = canonical
+        return canonical
 
     def h16raw(self):
         """
@@ -99,7 +200,13 @@ class LC3Value:
             >>> LC3Value(0x1234).h16raw()
             '1234'
         """
-        return f"{self._value:04X}"
+        # Interning means each distinct value runs the format exactly once;
+        # later calls return the cached string
+        try:
+            return self._hex
+        except AttributeError:
+            self._hex = f"{self._value:04X}"
+            return self._hex
     
     def to_bytes(self):
         """
@@ -137,7 +244,13 @@ class LC3Value:
             >>> str(LC3Value(0x1234))
             'x1234'
         """
-        return f"x{self._value:04X}"
+        # Instances are interned, so the formatted string is rendered once
+        # per distinct value and cached
+        try:
+            return self._str
+        except AttributeError:
+            self._str = f"x{self._value:04X}"
+            return self._str
 
     def __repr__(self):
         """
@@ -166,6 +279,14 @@ class LC3Value:
             return self._value == LC3Value(other)._value
         return False
 
+    def __hash__(self):
+        """
+        Hash by the 16-bit value, consistent with __eq__.
+
+        :return: Hash usable for dict/set membership
+        """
+        return hash(self._value)
+
     def __add__(self, other):
         """
         Add another value, returning a new LC3Value.
@@ -177,10 +298,13 @@ class LC3Value:
             >>> LC3Value(0x1000) + 0x234
             LC3Value(x1234)
         """
-        val = other
+        # Fast path for the common raw-int offset; masking here makes the
+        # intern lookup use the canonical 16-bit key
+        if type(other) is int:
+            return LC3Value((self._value + other) & 0xFFFF)
         if isinstance(other, LC3Value):
-            val = other._value
-        return LC3Value(self._value + val)
+            return LC3Value((self._value + other._value) & 0xFFFF)
+        return LC3Value(self._value + other)
 
     @property
     def signed(self):
@@ -195,9 +319,9 @@ class LC3Value:
             >>> LC3Value('x7FFF').signed
             32767
         """
-        if self._value & 0x8000:  # Check sign bit (bit 15)
-            return self._value - 0x10000
-        return self._value
+        # Branchless sign extension: flipping bit 15 and subtracting 0x8000
+        # maps 0x0000-0x7FFF to itself and 0x8000-0xFFFF to -32768..-1
+        return (self._value ^ 0x8000) - 0x8000
 
 
 class LC3Obj:
@@ -232,45 +356,86 @@ class LC3Obj:
         Example:
             >>> obj = LC3Obj(LC3Value('x4000'), "Hello".encode())
         """
-        self.buffer = bytearray(orig.to_bytes())
-        for item in data:
-            self.buffer.append(0x00)
-            self.buffer.append(item)
-        self.buffer.append(0x00)
-        self.buffer.append(0x00)
+        # Bulk construction: allocate the zero-filled image once and
+        # slice-assign the data bytes into the low byte of each word,
+        # instead of two appends per byte. The zero high bytes and the
+        # null-terminator word are already in place.
+        buffer = bytearray(2 + 2 * len(data) + 2)
+        buffer[:2] = orig.to_bytes()
+        buffer[3:3 + 2 * len(data):2] = data
+        self.buffer = buffer
         self.tmp_path = ''
-    
+        self._digest = None
+
+    @property
+    def origin(self):
+        """
+        Origin address of the image.
+
+        :return: Unsigned 16-bit load address
+        """
+        return int.from_bytes(self.buffer[:2], byteorder='big')
+
+    def words(self):
+        """
+        Word values of the image payload (origin header excluded).
+
+        :return: Tuple of unsigned 16-bit ints, one per memory word
+        """
+        return struct.unpack(f'>{(len(self.buffer) - 2) // 2}H', bytes(self.buffer[2:]))
+
     def to_file(self):
         """
         Write the object file to disk and return the path.
-        
-        Creates a temporary file in the 'tmp/' directory with a UUID filename.
+
+        Creates a uniquely-named file on tmpfs (/dev/shm) when available,
+        falling back to the system temp directory, so the few-KB image
+        never touches a real disk and there is no repo-local tmp/ litter.
         Subsequent calls return the same path without rewriting.
-        
+
         :return: Path to the temporary .obj file
-        
+
         Example:
             >>> obj = LC3Obj(LC3Value('x4000'), b'test')
-            >>> path = obj.to_file()  # e.g., 'tmp/abc123-def456.obj'
-        """
-        if self.tmp_path == '':
-            name = f'tmp/{uuid.uuid4()}.obj'
-            os.makedirs('tmp', exist_ok=True)
-            with open(name, 'wb') as f:
-                f.write(self.buffer)
-            self.tmp_path = name
+            >>> path = obj.to_file()  # e.g., '/dev/shm/lc3obj-abc123.obj'
+        """
+        if not self.tmp_path:
+            # Identical images share one refcounted file instead of each
+            # writing their own copy
+            self._digest = hashlib.blake2b(bytes(self.buffer), digest_size=16).hexdigest()
+            with _OBJ_FILES_LOCK:
+                entry = _OBJ_FILES.get(self._digest)
+                if entry is not None:
+                    entry[1] += 1
+                    self.tmp_path = entry[0]
+                else:
+                    tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+                    with tempfile.NamedTemporaryFile(prefix='lc3obj-', suffix='.obj',
+                                                     dir=tmp_dir, delete=False) as f:
+                        f.write(self.buffer)
+                        self.tmp_path = f.name
+                    _OBJ_FILES[self._digest] = [self.tmp_path, 1]
         return self.tmp_path
-    
+
     def __del__(self):
         """
-        Destructor that removes the temporary file.
-        
+        Destructor that drops this object's reference to the shared
+        temporary file, removing it once no other LC3Obj shares it.
+
         Called automatically when the object is garbage collected.
         """
         if self.tmp_path:
             try:
+                with _OBJ_FILES_LOCK:
+                    entry = _OBJ_FILES.get(self._digest)
+                    if entry is not None:
+                        entry[1] -= 1
+                        if entry[1] > 0:
+                            return
+                        del _OBJ_FILES[self._digest]
                 os.remove(self.tmp_path)
-            except OSError:
+            except (OSError, TypeError):
+                # TypeError: module globals torn down at interpreter exit
                 pass
 
 
@@ -290,35 +455,45 @@ class LC3Regs:
         >>> print(regs.R0.signed)
         4660
     """
-    
+
+    # The 8 registers live in one tuple; R0-R7 are generated properties
+    # indexing into it (see below the class body).
+    __slots__ = ('_vals',)
+
+    _NAMES = ('R0', 'R1', 'R2', 'R3', 'R4', 'R5', 'R6', 'R7')
+
     def __init__(self, reg_map={}):
         """
         Initialize registers, optionally from a dictionary.
-        
+
         :param reg_map: Optional dict mapping register names to LC3Value objects.
                        Expected keys: 'R0', 'R1', ..., 'R7'
-        
+
         Example:
             >>> regs = LC3Regs({'R0': LC3Value(0x1234), ...})
         """
-        self.R0 = LC3Value(0)
-        self.R1 = LC3Value(0)
-        self.R2 = LC3Value(0)
-        self.R3 = LC3Value(0)
-        self.R4 = LC3Value(0)
-        self.R5 = LC3Value(0)
-        self.R6 = LC3Value(0)
-        self.R7 = LC3Value(0)
         if reg_map:
-            self.R0 = reg_map['R0']
-            self.R1 = reg_map['R1']
-            self.R2 = reg_map['R2']
-            self.R3 = reg_map['R3']
-            self.R4 = reg_map['R4']
-            self.R5 = reg_map['R5']
-            self.R6 = reg_map['R6']
-            self.R7 = reg_map['R7']
-    
+            self._vals = tuple(reg_map[name] for name in self._NAMES)
+        else:
+            self._vals = (LC3Value(0),) * 8
+
+    def __getitem__(self, index):
+        """
+        Index registers numerically (regs[0] is R0).
+
+        :param index: Register number 0-7
+        :return: LC3Value of that register
+        """
+        return self._vals[index]
+
+    def __iter__(self):
+        """
+        Iterate the register values R0 through R7 in order.
+
+        :return: Iterator of LC3Value objects
+        """
+        return iter(self._vals)
+
     def __str__(self):
         """
         Get formatted string representation of all registers.
@@ -337,6 +512,12 @@ R7: {self.R7}
               '''
 
 
+# Generate the R0-R7 accessors as tuple-index properties
+for _index, _name in enumerate(LC3Regs._NAMES):
+    setattr(LC3Regs, _name, property(lambda self, _i=_index: self._vals[_i]))
+del _index, _name
+
+
 class LC3Response:
     """
     Parser for LC-3 simulator output after program execution.
@@ -354,23 +535,37 @@ class LC3Response:
         >>> print(response.raw_resp)  # Program output
         >>> print(response.regs.R0)   # Final R0 value
     """
-    
+
+    __slots__ = ('raw_resp', 'raw_status', '_regs')
+
     def __init__(self, raw_resp: str):
         """
         Parse simulator output from continue command.
-        
+
         :param raw_resp: Raw output string from simulator
-        
+
         The output is split at '--- halting the LC-3 ---' to separate
-        program output from register dump.
+        program output from register dump. The register dump itself is
+        parsed lazily on first access to .regs, so callers that only
+        diff the program output never pay for it.
         """
         segs = raw_resp.strip().split('--- halting the LC-3 ---')
-        
+
         self.raw_resp = segs[0]
         self.raw_status = segs[1]
-        regs = self.parse_registers(self.raw_status)
-        self.regs = LC3Regs(regs)
-    
+        self._regs = None
+
+    @property
+    def regs(self):
+        """
+        Final register values, parsed from the status dump on first access.
+
+        :return: LC3Regs object
+        """
+        if self._regs is None:
+            self._regs = LC3Regs(self.parse_registers(self.raw_status))
+        return self._regs
+
     def parse_registers(self, output_str):
         """
         Parse register values from simulator output.
@@ -382,15 +577,7 @@ class LC3Response:
             PC=x0494 IR=xB1AE PSR=x0400 (ZERO)
             R0=x0000 R1=x7FFF R2=x0000 R3=x0000 R4=x0000 R5=x0000 R6=x0000 R7=x0490
         """
-        pattern = r'(\w+)=(x[\da-fA-F]+)'
-        matches = re.findall(pattern, output_str)
-        reg_dict_str = dict(matches)
-        
-        reg_dict_val = {}
-        for key, val in matches:
-            reg_dict_val[key] = LC3Value(val)
-            
-        return reg_dict_val
+        return {key: LC3Value(val) for key, val in _REG_PATTERN.findall(output_str)}
     
     def diff_resp(self, expect_txt: str):
         """
@@ -408,17 +595,19 @@ class LC3Response:
             ... else:
             ...     print("Test failed - see diff above")
         """
-        # Data cleaning: split by lines, strip whitespace
-        expect_lines = [line.strip() for line in expect_txt.strip().splitlines()]
-        actual_lines = [line.strip() for line in self.raw_resp.strip().splitlines()]
+        # C-speed prefilter: byte-identical text can't diff, so skip the
+        # per-line normalization entirely on the (common) passing path
+        if expect_txt == self.raw_resp or expect_txt.strip() == self.raw_resp.strip():
+            return True
+
+        # Data cleaning: split by lines, strip whitespace (one regex pass)
+        expect_lines = _norm_lines(expect_txt)
+        actual_lines = _norm_lines(self.raw_resp)
 
         # Quick check: if identical, return True immediately
         if expect_lines == actual_lines:
             return True
 
-        # Calculate total lines (take max of both to handle missing lines)
-        max_lines = max(len(expect_lines), len(actual_lines))
-        
         # Calculate max width for expected column for alignment
         max_width = max([len(line) for line in expect_lines]) if expect_lines else 10
         col_width = max_width + 4
@@ -427,28 +616,34 @@ class LC3Response:
         GREEN = '\033[92m'
         RED = '\033[91m'
         RESET = '\033[0m'
-        
+
         print("\n" + "="*60)
         print(f"❌  (Diff Report)")
         print(f"{'Line':<5} {'Expected (Correct)':<{col_width}} {'Actual (Original)'}")
         print("-" * (col_width + 30))
 
-        # Iterate and print line by line
-        for i in range(max_lines):
-            exp_str = expect_lines[i] if i < len(expect_lines) else "<MISSING>"
-            act_str = actual_lines[i] if i < len(actual_lines) else "<MISSING>"
-            is_match = (exp_str == act_str)
+        # Align the two sides with SequenceMatcher so a single inserted or
+        # dropped line doesn't cascade into a wall of spurious mismatches
+        # the way a positional walk would
+        matcher = difflib.SequenceMatcher(None, expect_lines, actual_lines, autojunk=False)
+        row = 0
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            for k in range(max(i2 - i1, j2 - j1)):
+                exp_str = expect_lines[i1 + k] if i1 + k < i2 else "<MISSING>"
+                act_str = actual_lines[j1 + k] if j1 + k < j2 else "<MISSING>"
+                is_match = (tag == 'equal')
 
-            color_line = GREEN if is_match else RED
-            color_exp = GREEN
-            color_act = GREEN if is_match else RED
+                color_line = GREEN if is_match else RED
+                color_exp = GREEN
+                color_act = GREEN if is_match else RED
 
-            line_num_str = f"{i+1}".ljust(5)
-            exp_str_padded = exp_str.ljust(col_width)
+                row += 1
+                line_num_str = f"{row}".ljust(5)
+                exp_str_padded = exp_str.ljust(col_width)
 
-            print(f"{color_line}{line_num_str}{RESET} "
-                  f"{color_exp}{exp_str_padded}{RESET} "
-                  f"{color_act}{act_str}{RESET}")
+                print(f"{color_line}{line_num_str}{RESET} "
+                      f"{color_exp}{exp_str_padded}{RESET} "
+                      f"{color_act}{act_str}{RESET}")
 
         print("="*60 + "\n")
         print("Diff Failed\n")
@@ -488,16 +683,45 @@ class LC3Sim:
         >>> print(response.regs.R0)
     """
     
-    def __init__(self):
+    def __init__(self, target=None):
         """
         Initialize the LC-3 simulator.
-        
+
         Spawns an lc3sim process and waits for the prompt.
-        
+
+        :param target: Optional .obj path to load immediately after spawn,
+                       so a pooled simulator comes up warm with its program
         :raises Exception: If lc3sim is not found or fails to start
         """
         self.child = pexpect.spawn('lc3sim', encoding='utf-8')
+        # pexpect sleeps 50ms before every send by default as a kludge for
+        # slow readers; lc3sim keeps up fine, so drop it. expect() must scan
+        # the whole buffer (the default searchwindowsize): pipelined bursts
+        # queue several echo+prompt pairs at once, and a bounded window
+        # would skip any prompt that has already scrolled past it.
+        self.child.delaybeforesend = 0
         self.wait_for_input()
+        if target is not None:
+            self.load_file(target)
+
+    def close(self):
+        """
+        Terminate the underlying lc3sim process.
+
+        Safe to call more than once; a closed simulator cannot be reused.
+        """
+        if self.child is not None:
+            self.child.close(force=True)
+            self.child = None
+
+    @property
+    def closed(self):
+        """
+        Whether the simulator process has been terminated.
+
+        :return: True once close() has been called
+        """
+        return self.child is None
     
     def wait_for_input(self) -> str:
         """
@@ -530,28 +754,58 @@ class LC3Sim:
         Register values set:
             R0=x1234, R1=x5678, R2=x9ABC, R3=xDEF0,
             R4=x1111, R5=x2222, R6=x3333, R7=x4444
-        """
-        self.send_command("r r0 x1234")
-        self.send_command("r r1 x5678")
-        self.send_command("r r2 x9ABC")
-        self.send_command("r r3 xDEF0")
-        self.send_command("r r4 x1111")
-        self.send_command("r r5 x2222")
-        self.send_command("r r6 x3333")
-        self.send_command("r r7 x4444")
+
+        All 8 writes are pipelined in one burst rather than 8 round-trips.
+        """
+        self.send_commands([
+            "r r0 x1234",
+            "r r1 x5678",
+            "r r2 x9ABC",
+            "r r3 xDEF0",
+            "r r4 x1111",
+            "r r5 x2222",
+            "r r6 x3333",
+            "r r7 x4444",
+        ])
     
     def send_command(self, command):
         """
         Send a command to the simulator and return the response.
-        
+
         :param command: Command string to send (e.g., 'file prog.obj')
         :return: Simulator response with command echo removed
-        
+
         Example:
             >>> sim.send_command('file test.obj')
         """
         self.child.sendline(command)
         return self.wait_for_input().replace(command, '').strip()
+
+    def send_commands(self, commands):
+        """
+        Send a batch of commands in pipelined bursts and collect all responses.
+
+        Commands are written in bursts of up to _MAX_BURST, then the queued
+        prompts are drained in order before the next burst. This pipelines
+        the round-trips so N commands cost roughly N/_MAX_BURST trips over
+        the pty instead of N, while the cap keeps a long block of writes
+        from overrunning the pty input buffer.
+
+        :param commands: Iterable of command strings
+        :return: List of responses, one per command, with echoes removed
+
+        Example:
+            >>> sim.send_commands(['r r0 x1234', 'r r1 x5678'])
+        """
+        commands = list(commands)
+        responses = []
+        for start in range(0, len(commands), _MAX_BURST):
+            burst = commands[start:start + _MAX_BURST]
+            for command in burst:
+                self.child.sendline(command)
+            for command in burst:
+                responses.append(self.wait_for_input().replace(command, '').strip())
+        return responses
     
     def set_pc(self, pc: LC3Value):
         """
@@ -577,6 +831,22 @@ class LC3Sim:
         """
         return self.send_command(f'file {file}')
     
+    def load_obj(self, obj):
+        """
+        Load an LC3Obj image directly into simulator memory.
+
+        Writes the image's words via write_block instead of going through
+        a temporary .obj file and the simulator's 'file' command, skipping
+        the disk round-trip entirely.
+
+        :param obj: LC3Obj instance to load
+
+        Example:
+            >>> obj = LC3Obj(LC3Value('x4000'), b'Hello')
+            >>> sim.load_obj(obj)
+        """
+        self.write_block(obj.origin, obj.words())
+
     def write_mem(self, addr: LC3Value, data: LC3Value):
         """
         Write a value to a memory address.
@@ -605,12 +875,75 @@ class LC3Sim:
         """
         raw = self.send_command(f'translate {str(addr)}')
         # Parse "Address x0300 has value x0065."
-        pattern = r'Address\s+x[\da-fA-F]+\s+has\s+value\s+(x[\da-fA-F]+)'
-        match = re.search(pattern, raw)
+        match = _MEM_PATTERN.search(raw)
         if match:
             return LC3Value(match.group(1))
         raise ValueError(f"Failed to parse memory read response: {raw}")
 
+    @staticmethod
+    def _unpack_words(values):
+        """
+        Normalize block data into a list of 16-bit word integers.
+
+        :param values: bytes/bytearray of big-endian uint16 words, or an
+                       iterable of int/str/LC3Value items
+        :return: List of unsigned 16-bit integers
+        """
+        if isinstance(values, (bytes, bytearray)):
+            if len(values) % 2 != 0:
+                raise ValueError("Block data must be an even number of bytes (16-bit words)")
+            return list(struct.unpack(f'>{len(values) // 2}H', bytes(values)))
+        return [int(v) & 0xFFFF if isinstance(v, (int, LC3Value)) else int(LC3Value(v)) for v in values]
+
+    def write_block(self, addr: LC3Value, values):
+        """
+        Write a contiguous block of words starting at an address.
+
+        All 'memory' commands are pipelined through a single batch, so the
+        whole block costs one round-trip burst instead of one per word.
+
+        :param addr: Start address of the block (LC3Value or raw int)
+        :param values: bytes of big-endian uint16 words, or an iterable of
+                       int/str/LC3Value word values
+
+        Example:
+            >>> sim.write_block(0x4000, [0x41, 0x42, 0x43])
+            >>> sim.write_block(LC3Value('x4000'), b'\\x00A\\x00B\\x00C')
+        """
+        base = int(addr)
+        words = self._unpack_words(values)
+        self.send_commands(
+            f'memory x{(base + i) & 0xFFFF:04X} x{word:04X}'
+            for i, word in enumerate(words)
+        )
+
+    def read_block(self, addr: LC3Value, count: int):
+        """
+        Read a contiguous block of words starting at an address.
+
+        Pipelines all 'translate' commands into a single batch.
+
+        :param addr: Start address of the block (LC3Value or raw int)
+        :param count: Number of words to read
+        :return: List of LC3Value objects, one per word
+        :raises ValueError: If a response cannot be parsed
+
+        Example:
+            >>> values = sim.read_block(LC3Value('x4000'), 5)
+            >>> values = sim.read_block(0x4000, 5)
+        """
+        base = int(addr)
+        raws = self.send_commands(
+            f'translate x{(base + i) & 0xFFFF:04X}' for i in range(count)
+        )
+        values = []
+        for raw in raws:
+            match = _MEM_PATTERN.search(raw)
+            if not match:
+                raise ValueError(f"Failed to parse memory read response: {raw}")
+            values.append(LC3Value(match.group(1)))
+        return values
+
     def read_regs(self) -> LC3Regs:
         """
         Read all register values from the simulator.
@@ -634,12 +967,7 @@ class LC3Sim:
         :param output_str: Raw output from printregs command
         :return: Dictionary mapping register names to LC3Value objects
         """
-        pattern = r'(\w+)=(x[\da-fA-F]+)'
-        matches = re.findall(pattern, output_str)
-        reg_dict = {}
-        for key, val in matches:
-            reg_dict[key] = LC3Value(val)
-        return reg_dict
+        return {key: LC3Value(val) for key, val in _REG_PATTERN.findall(output_str)}
 
     def set_reg(self, reg: str, data: LC3Value):
         """
@@ -673,6 +1001,25 @@ class LC3Sim:
         return LC3Response(raw)
 
 
+# Worker-process-level instance for the use_processes backend: the pool
+# initializer unpickles the test object once per worker and every case in
+# that worker runs against it, so worker-local sim pooling (get_sim) and
+# any pregenerated inputs are shared across the worker's cases instead of
+# being re-pickled and rebuilt per case.
+_process_test_instance = None
+
+
+def _process_worker_init(instance):
+    """Pool initializer: adopt the one test instance for this worker."""
+    global _process_test_instance
+    _process_test_instance = instance
+
+
+def _process_run_case(case_num):
+    """Run one case against the worker's cached test instance."""
+    return _process_test_instance._run_single_case(case_num)
+
+
 class LC3RandomGenTests:
     """
     Framework for running parallel randomized test cases.
@@ -695,28 +1042,31 @@ class LC3RandomGenTests:
         >>> tests = MyTests(test_nums=100, max_workers=8)
         >>> tests.run_all()
     """
-    
-    class Colors:
-        """ANSI color codes for terminal output."""
-        HEADER = '\033[95m'
-        BLUE = '\033[94m'
-        CYAN = '\033[96m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        RESET = '\033[0m'
-        BOLD = '\033[1m'
-        UNDERLINE = '\033[4m'
 
-    def __init__(self, test_nums=100, max_workers=None):
+    # Shared module-level palette (kept as a class attribute for callers
+    # that reference e.g. LC3RandomGenTests.Colors.GREEN)
+    Colors = _Colors
+
+    def __init__(self, test_nums=100, max_workers=None, use_processes=False):
         """
         Initialize the parallel random test framework.
-        
+
         :param test_nums: Number of test cases to run (default: 100)
         :param max_workers: Maximum parallel workers (default: min(32, cpu_count + 4))
+        :param use_processes: Run cases on a ProcessPoolExecutor instead of
+                              threads. Worth it when run_case is CPU-bound in
+                              Python (heavy expected-output computation); the
+                              default stays threads because typical cases
+                              block on the lc3sim subprocess and release the
+                              GIL anyway. Requires the subclass to be defined
+                              at module level (picklable). Each worker
+                              process unpickles the test object once at pool
+                              startup and reuses it (including its get_sim
+                              simulator pool) for all its cases.
         """
         self.test_nums = test_nums
         self.max_workers = max_workers
+        self.use_processes = use_processes
         self.passed_count = 0
         self.failed_count = 0
         self.failed_cases = []
@@ -724,6 +1074,28 @@ class LC3RandomGenTests:
         self.end_time = 0
         self._lock = threading.Lock()
         self._completed = 0
+        self._next_case = 1
+        self._tls = threading.local()
+        self._sims = []
+
+    def __getstate__(self):
+        """
+        Drop unpicklable worker state when shipping self to process workers.
+        """
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        state.pop('_tls', None)
+        state.pop('_sims', None)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Recreate per-process lock and thread-local storage after unpickling.
+        """
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._sims = []
 
     def run_case(self, case_num):
         """
@@ -763,6 +1135,141 @@ class LC3RandomGenTests:
             error_msg = f"{type(e).__name__}: {str(e)}"
             return (case_num, False, error_msg)
 
+    def make_sim(self):
+        """
+        Create the simulator instance for a worker. Override to customize
+        (e.g., preload a target file).
+
+        :return: A fresh LC3Sim instance
+        """
+        return LC3Sim()
+
+    def get_sim(self):
+        """
+        Get this worker thread's persistent LC3Sim instance.
+
+        The simulator subprocess is spawned once per worker on first use and
+        reused for every case that worker claims, instead of paying the
+        lc3sim startup cost on each case. Call from run_case():
+
+            >>> def run_case(self, case_num):
+            ...     sim = self.get_sim()
+            ...     sim.load_file(self.target)
+            ...     ...
+
+        :return: The worker-local LC3Sim instance
+        """
+        sim = getattr(self._tls, 'sim', None)
+        if sim is None or sim.closed:
+            sim = self.make_sim()
+            self._tls.sim = sim
+            with self._lock:
+                self._sims.append(sim)
+        return sim
+
+    def close_sims(self):
+        """
+        Terminate every persistent worker simulator.
+
+        The pool stays alive across run_all() invocations so repeated runs
+        reuse warm processes; call this when the suite is done to reclaim
+        the lc3sim subprocesses. Workers transparently respawn on next use.
+        """
+        with self._lock:
+            sims, self._sims = self._sims, []
+        for sim in sims:
+            sim.close()
+
+    def _claim_case(self):
+        """
+        Claim the next unprocessed case number from the shared counter.
+
+        Workers call this repeatedly to steal work, so fast workers keep
+        pulling cases instead of idling on a pre-sliced range.
+
+        :return: Case number to run, or None when all cases are claimed
+        """
+        with self._lock:
+            case_num = self._next_case
+            if case_num > self.test_nums:
+                return None
+            self._next_case += 1
+            return case_num
+
+    def _worker_loop(self):
+        """
+        Worker body: claim and run cases until the counter is exhausted.
+
+        Pass/fail tallies accumulate in worker-local variables and merge
+        into the shared state once at exit; the per-case critical section
+        only covers the completion counter, the progress redraw, and the
+        (rare) streamed failure line.
+        """
+        local_passed = 0
+        local_failed = []
+        while True:
+            case_num = self._claim_case()
+            if case_num is None:
+                break
+            case_num, passed, error_msg = self._run_single_case(case_num)
+            if passed:
+                local_passed += 1
+            else:
+                local_failed.append({'id': case_num, 'reason': error_msg})
+
+            with self._lock:
+                if not passed:
+                    # Stream the failure immediately instead of holding every
+                    # detail back until the final report (clear the progress
+                    # line first; the reporter thread redraws it)
+                    sys.stdout.write(f"\r\033[K{self.Colors.RED}Case {case_num} FAILED: {error_msg}{self.Colors.RESET}\n")
+                self._completed += 1
+
+        with self._lock:
+            self.passed_count += local_passed
+            self.failed_count += len(local_failed)
+            self.failed_cases.extend(local_failed)
+
+    def _run_all_processes(self):
+        """
+        Process-pool backend for run_all: one future per case, results
+        tallied in the parent as they complete. Sidesteps the GIL for
+        CPU-bound run_case implementations. self is pickled once per
+        worker via the pool initializer, so each worker's cached instance
+        keeps its pooled simulators and pregenerated inputs for every
+        case it runs.
+        """
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_process_worker_init,
+                                 initargs=(self,)) as executor:
+            futures = [executor.submit(_process_run_case, i) for i in range(1, self.test_nums + 1)]
+
+            for future in as_completed(futures):
+                case_num, passed, error_msg = future.result()
+                if passed:
+                    self.passed_count += 1
+                else:
+                    self.failed_count += 1
+                    self.failed_cases.append({'id': case_num, 'reason': error_msg})
+                    sys.stdout.write(f"\r\033[K{self.Colors.RED}Case {case_num} FAILED: {error_msg}{self.Colors.RESET}\n")
+
+                self._completed += 1
+
+    def _progress_reporter(self, stop_event, interval=0.1):
+        """
+        Background thread body: redraw the progress bar at a fixed rate.
+
+        Decouples terminal I/O from case completion, so workers only bump
+        the completion counter and never block on a stdout flush.
+
+        :param stop_event: threading.Event signalling the run is over
+        :param interval: Seconds between redraws
+        """
+        while not stop_event.is_set():
+            with self._lock:
+                self._print_progress(self._completed, self.test_nums)
+            stop_event.wait(interval)
+
     def _print_progress(self, current, total, bar_length=40):
         """
         Print a real-time progress bar to stdout.
@@ -780,37 +1287,42 @@ class LC3RandomGenTests:
     def run_all(self):
         """
         Execute all test cases in parallel.
-        
-        Uses ThreadPoolExecutor to run tests concurrently, displaying
-        a progress bar and generating a final report.
+
+        Spawns max_workers worker threads that claim case numbers from a
+        shared counter (work stealing), displaying a progress bar and
+        generating a final report. Compared to pre-slicing the case range,
+        the shared counter keeps every worker busy until the very last case.
         """
         print(f"{self.Colors.HEADER}{self.Colors.BOLD}>>> Starting LC3 Parallel Random Tests ({self.test_nums} test cases)...{self.Colors.RESET}")
-        
+
         if self.max_workers is None:
-            self.max_workers = min(32, (os.cpu_count() or 1) + 4)
-        
+            self.max_workers = _DEFAULT_MAX_WORKERS
+
         print(f"{self.Colors.CYAN}Using {self.max_workers} parallel workers{self.Colors.RESET}\n")
-        
-        self.start_time = time.time()
+
+        self.start_time = time.perf_counter()
         self._completed = 0
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(self._run_single_case, i): i for i in range(1, self.test_nums + 1)}
-            
-            for future in as_completed(futures):
-                case_num, passed, error_msg = future.result()
-                
-                with self._lock:
-                    if passed:
-                        self.passed_count += 1
-                    else:
-                        self.failed_count += 1
-                        self.failed_cases.append({'id': case_num, 'reason': error_msg})
-                    
-                    self._completed += 1
-                    self._print_progress(self._completed, self.test_nums)
-
-        self.end_time = time.time()
+        self._next_case = 1
+
+        stop_event = threading.Event()
+        reporter = threading.Thread(target=self._progress_reporter, args=(stop_event,), daemon=True)
+        reporter.start()
+
+        try:
+            if self.use_processes:
+                self._run_all_processes()
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    workers = [executor.submit(self._worker_loop) for _ in range(self.max_workers)]
+                    for worker in as_completed(workers):
+                        worker.result()
+        finally:
+            stop_event.set()
+            reporter.join()
+            # Final draw so the bar always ends at the true completion count
+            self._print_progress(self._completed, self.test_nums)
+
+        self.end_time = time.perf_counter()
         print("\n")
         
         self.failed_cases.sort(key=lambda x: x['id'])
@@ -819,41 +1331,44 @@ class LC3RandomGenTests:
     def report(self):
         """
         Print the final test report with statistics and failure details.
-        
+
         Shows duration, throughput, pass/fail counts, and details of
-        failed test cases (up to 10).
+        failed test cases (up to 10). The whole report is assembled first
+        and emitted in a single buffered stdout write.
         """
         duration = self.end_time - self.start_time
-        
-        print(f"{self.Colors.HEADER}{'='*60}{self.Colors.RESET}")
-        print(f"{self.Colors.BOLD}Test Report (Parallel){self.Colors.RESET}")
-        print(f"{self.Colors.HEADER}{'='*60}{self.Colors.RESET}")
-        
-        print(f"Duration:     {duration:.4f} seconds")
-        print(f"Avg Time:     {duration/self.test_nums*1000:.2f} ms/case")
-        print(f"Throughput:   {self.test_nums/duration:.1f} cases/sec")
-        
-        print(f"Total:        {self.test_nums}")
-        print(f"{self.Colors.GREEN}Passed:       {self.passed_count}{self.Colors.RESET}")
-        
+
+        lines = [
+            f"{self.Colors.HEADER}{'='*60}{self.Colors.RESET}",
+            f"{self.Colors.BOLD}Test Report (Parallel){self.Colors.RESET}",
+            f"{self.Colors.HEADER}{'='*60}{self.Colors.RESET}",
+            f"Duration:     {duration:.4f} seconds",
+            f"Avg Time:     {duration/self.test_nums*1000:.2f} ms/case",
+            f"Throughput:   {self.test_nums/duration:.1f} cases/sec",
+            f"Total:        {self.test_nums}",
+            f"{self.Colors.GREEN}Passed:       {self.passed_count}{self.Colors.RESET}",
+        ]
+
         if self.failed_count > 0:
-            print(f"{self.Colors.RED}Failed:       {self.failed_count}{self.Colors.RESET}")
-            print(f"{self.Colors.YELLOW}Pass Rate:    {self.passed_count/self.test_nums*100:.2f}%{self.Colors.RESET}")
-            
-            print(f"\n{self.Colors.RED}>>> Failure Details:{self.Colors.RESET}")
-            print(f"{'-'*60}")
-            print(f"{'Case ID':<10} | {'Error Reason'}")
-            print(f"{'-'*60}")
-            
-            for fail in self.failed_cases[:10]:
-                print(f"Case {fail['id']:<5} | {fail['reason']}")
-            
+            lines.append(f"{self.Colors.RED}Failed:       {self.failed_count}{self.Colors.RESET}")
+            lines.append(f"{self.Colors.YELLOW}Pass Rate:    {self.passed_count/self.test_nums*100:.2f}%{self.Colors.RESET}")
+
+            lines.append(f"\n{self.Colors.RED}>>> Failure Details:{self.Colors.RESET}")
+            lines.append(f"{'-'*60}")
+            lines.append(f"{'Case ID':<10} | {'Error Reason'}")
+            lines.append(f"{'-'*60}")
+
+            lines.extend(f"Case {fail['id']:<5} | {fail['reason']}" for fail in self.failed_cases[:10])
+
             if len(self.failed_cases) > 10:
-                print(f"... ({len(self.failed_cases)-10} more failures not shown)")
+                lines.append(f"... ({len(self.failed_cases)-10} more failures not shown)")
         else:
-            print(f"\n{self.Colors.GREEN}{self.Colors.BOLD}🎉 All Tests Passed! 🎉{self.Colors.RESET}")
+            lines.append(f"\n{self.Colors.GREEN}{self.Colors.BOLD}🎉 All Tests Passed! 🎉{self.Colors.RESET}")
 
-        print(f"{self.Colors.HEADER}{'='*60}{self.Colors.RESET}\n")
+        lines.append(f"{self.Colors.HEADER}{'='*60}{self.Colors.RESET}\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 class LC3SequenceTest:
@@ -877,18 +1392,10 @@ class LC3SequenceTest:
         ...     return True
         >>> tests.run_all()
     """
-    
-    class Colors:
-        """ANSI color codes for terminal output."""
-        HEADER = '\033[95m'
-        BLUE = '\033[94m'
-        CYAN = '\033[96m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        RESET = '\033[0m'
-        BOLD = '\033[1m'
-        UNDERLINE = '\033[4m'
+
+    # Shared module-level palette (kept as a class attribute for callers
+    # that reference e.g. LC3SequenceTest.Colors.GREEN)
+    Colors = _Colors
 
     def __init__(self, name="LC3 Sequence Test"):
         """
@@ -919,6 +1426,23 @@ class LC3SequenceTest:
         self.test_cases.append((name, test_func))
         return self
 
+    def add_tests(self, cases):
+        """
+        Register many test cases at once from a declarative table.
+
+        :param cases: Iterable of (name, test_func) tuples
+        :return: self (for method chaining)
+
+        Example:
+            >>> tests.add_tests([
+            ...     ("Test A", lambda: True),
+            ...     ("Test B", my_test_function),
+            ... ])
+        """
+        for name, test_func in cases:
+            self.add_test(name, test_func)
+        return self
+
     def test(self, name):
         """
         Decorator to add a test function.
@@ -936,46 +1460,71 @@ class LC3SequenceTest:
             return func
         return decorator
 
-    def run_all(self):
+    def _execute_case(self, test_func):
         """
-        Execute all registered test cases sequentially.
-        
+        Run a single test case and capture its outcome.
+
+        :param test_func: The test callable
+        :return: Tuple of (passed: bool, error_msg or None, duration_ms)
+        """
+        case_start = time.perf_counter()
+        try:
+            result = test_func()
+            case_duration = (time.perf_counter() - case_start) * 1000
+            if result:
+                return (True, None, case_duration)
+            return (False, "Returned False", case_duration)
+        except Exception as e:
+            case_duration = (time.perf_counter() - case_start) * 1000
+            return (False, f"{type(e).__name__}: {str(e)}", case_duration)
+
+    def run_all(self, parallel=False, max_workers=None):
+        """
+        Execute all registered test cases.
+
         Prints a table showing each test result and timing,
         then generates a summary report.
+
+        :param parallel: Run cases on a thread pool instead of sequentially.
+                         Only safe when the cases don't share a simulator or
+                         other mutable state. The result table stays in
+                         registration order either way.
+        :param max_workers: Pool size when parallel (default: min(32, cpu_count + 4))
         """
         total = len(self.test_cases)
         print(f"{self.Colors.HEADER}{self.Colors.BOLD}>>> Starting {self.name} ({total} test cases)...{self.Colors.RESET}\n")
         print(f"{'-'*70}")
         print(f"{'#':<4} {'Test Name':<45} {'Result':<10} {'Time'}")
         print(f"{'-'*70}")
-        
-        self.start_time = time.time()
-        
-        for idx, (test_name, test_func) in enumerate(self.test_cases, 1):
-            case_start = time.time()
-            try:
-                result = test_func()
-                case_duration = (time.time() - case_start) * 1000
-                
-                if result:
+
+        self.start_time = time.perf_counter()
+
+        if parallel:
+            if max_workers is None:
+                max_workers = _DEFAULT_MAX_WORKERS
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            outcomes = executor.map(self._execute_case, (func for _, func in self.test_cases))
+        else:
+            executor = None
+            outcomes = map(self._execute_case, (func for _, func in self.test_cases))
+
+        try:
+            for idx, ((test_name, _), (passed, error_msg, case_duration)) in enumerate(zip(self.test_cases, outcomes), 1):
+                if passed:
                     self.passed_count += 1
-                    status = f"{self.Colors.GREEN}PASS{self.Colors.RESET}"
+                    status = _STATUS_PASS
                 else:
                     self.failed_count += 1
-                    self.failed_cases.append({'name': test_name, 'reason': "Returned False"})
-                    status = f"{self.Colors.RED}FAIL{self.Colors.RESET}"
-                    
-            except Exception as e:
-                case_duration = (time.time() - case_start) * 1000
-                self.failed_count += 1
-                error_msg = f"{type(e).__name__}: {str(e)}"
-                self.failed_cases.append({'name': test_name, 'reason': error_msg})
-                status = f"{self.Colors.RED}ERROR{self.Colors.RESET}"
-
-            display_name = test_name[:42] + "..." if len(test_name) > 45 else test_name
-            print(f"{idx:<4} {display_name:<45} {status:<19} {case_duration:.2f}ms")
-
-        self.end_time = time.time()
+                    self.failed_cases.append({'name': test_name, 'reason': error_msg})
+                    status = _STATUS_FAIL if error_msg == "Returned False" else _STATUS_ERROR
+
+                display_name = test_name[:42] + "..." if len(test_name) > 45 else test_name
+                print(f"{idx:<4} {display_name:<45} {status:<19} {case_duration:.2f}ms")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.end_time = time.perf_counter()
         print(f"{'-'*70}\n")
         self.report()
 
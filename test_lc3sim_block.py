@@ -0,0 +1,81 @@
+"""
+Regression tests for pipelined block transfers.
+
+write_block/read_block queue many echo+prompt pairs in the pexpect buffer
+before draining; a bounded searchwindowsize once made every prompt outside
+the window invisible, stalling the whole burst until timeout. These tests
+round-trip blocks well past any single-burst size against a minimal
+lc3sim stand-in (written to a temp dir and put on PATH), so they need
+pexpect but not the real lc3tools install.
+"""
+
+import os
+import stat
+
+import pytest
+
+from lc3sim import LC3Sim
+
+# Minimal prompt-driven lc3sim replica: supports the 'memory' and
+# 'translate' commands that block transfers are built on.
+_FAKE_LC3SIM = '''#!/usr/bin/env python3
+import re
+import sys
+
+_MEM = {}
+_MEMORY_RE = re.compile(r'memory\\s+x([0-9a-fA-F]+)\\s+x([0-9a-fA-F]+)')
+_TRANSLATE_RE = re.compile(r'translate\\s+x([0-9a-fA-F]+)')
+
+
+def prompt():
+    sys.stdout.write('(lc3sim) ')
+    sys.stdout.flush()
+
+
+prompt()
+for line in sys.stdin:
+    line = line.strip()
+    m = _MEMORY_RE.fullmatch(line)
+    if m:
+        _MEM[int(m.group(1), 16)] = int(m.group(2), 16)
+        prompt()
+        continue
+    m = _TRANSLATE_RE.fullmatch(line)
+    if m:
+        addr = int(m.group(1), 16)
+        print(f'Address x{addr:04X} has value x{_MEM.get(addr, 0):04X}.')
+        prompt()
+        continue
+    prompt()
+'''
+
+
+@pytest.fixture
+def fake_lc3sim(tmp_path, monkeypatch):
+    """Put a fake 'lc3sim' executable at the front of PATH."""
+    script = tmp_path / 'lc3sim'
+    script.write_text(_FAKE_LC3SIM)
+    script.chmod(script.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    monkeypatch.setenv('PATH', f'{tmp_path}{os.pathsep}' + os.environ.get('PATH', ''))
+
+
+def _roundtrip(words):
+    sim = LC3Sim()
+    try:
+        sim.write_block(0x4000, words)
+        values = sim.read_block(0x4000, len(words))
+    finally:
+        sim.close()
+    return [int(v) for v in values]
+
+
+def test_block_roundtrip_beyond_one_prompt(fake_lc3sim):
+    # 30 words: enough queued prompts to overflow any bounded search window
+    words = list(range(30))
+    assert _roundtrip(words) == words
+
+
+def test_block_roundtrip_full_mp1_image(fake_lc3sim):
+    # 522 words matches a 500-char MP1 input image plus origin/terminator
+    words = [(i * 257) & 0xFFFF for i in range(522)]
+    assert _roundtrip(words) == words
@@ -0,0 +1,33 @@
+"""
+pytest front-end for the MP1 random cases.
+
+Each seed becomes an independent test ID, so pytest-xdist can spread the
+cases across workers and any failure pins down its exact seed:
+
+    LC3TEST_TARGET=mp1.obj pytest -n auto test_mp1_random.py
+
+Without LC3TEST_TARGET set (no target/simulator available) the whole
+module is skipped, keeping plain `pytest` collection green.
+"""
+
+import os
+import random
+
+import pytest
+
+from test_mp1 import generate_and_count, run_single_test
+
+TARGET = os.environ.get('LC3TEST_TARGET')
+
+pytestmark = pytest.mark.skipif(
+    TARGET is None,
+    reason="set LC3TEST_TARGET to the MP1 .obj under test",
+)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_mp1_random(seed):
+    """One seeded random case; the seed reproduces the exact input."""
+    random.seed(seed)
+    random_str, _, _ = generate_and_count(random.randint(100, 500))
+    assert run_single_test(TARGET, random_str)